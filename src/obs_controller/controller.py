@@ -1,39 +1,159 @@
 import os
+import re
+import sys
+import ctypes
+from ctypes import wintypes
 import time
 import logging
 import atexit
-from functools import wraps
-import win32com.client
+import threading
+from functools import lru_cache, wraps
 import subprocess
-import shutil
-import configparser
-import pythoncom
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
-from obswebsocket import obsws, requests
+from types import SimpleNamespace
+from typing import Iterator
 
 from .exceptions import OBSConnectionError, OBSProcessError, OBSWebSocketError
 
 logger = logging.getLogger("obs_controller")
 
+_WS_SECTION_RE = re.compile(r'^\[OBSWebSocket\][^\n]*\n?(.*?)(?=^\[|\Z)', re.M | re.S)
+_WS_KEY_RE = re.compile(r'^(ServerEnabled|ServerPort|ServerPassword)=[^\r\n]*', re.M)
+
+@lru_cache(maxsize=None)
+def _lazy_obsws():
+    """
+    Imports obswebsocket on first use, so importing obs_controller does not pull in the WebSocket client.
+
+    Returns:
+        tuple: The `obsws` class and the `events` and `requests` modules.
+    """
+    from obswebsocket import obsws, events, requests
+    return obsws, events, requests
+
+
+_TH32CS_SNAPPROCESS = 0x00000002
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _kernel32():
+    """
+    Loads kernel32 on first use and declares the prototypes of the Toolhelp functions used by `_process_exists`.
+
+    Returns:
+        ctypes.WinDLL: The kernel32 library.
+    """
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    return kernel32
+
+
+def _process_exists(process_name: str) -> bool:
+    """
+    Checks if a process with the given executable name is running.
+
+    On Windows a single Toolhelp snapshot of the process table is walked, other platforms fall back to psutil.
+
+    Args:
+        process_name (str): The executable name to look for, compared case-insensitively.
+
+    Returns:
+        bool: `True` if a matching process is found, `False` otherwise.
+    """
+    process_name = process_name.lower()
+    if sys.platform != "win32":
+        import psutil
+        return any((p.info["name"] or "").lower() == process_name for p in psutil.process_iter(["name"]))
+
+    kernel32 = _kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == process_name:
+                return True
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+
 class OBSController:
+    PROCESS_CACHE_TTL = 1.0 # Seconds to cache the result of is_process_running
+    REPLAY_POLL_INTERVAL = 1.0 # Seconds between save path checks while waiting for a replay
+    CLEANUP_WORKERS = 4 # Threads used to delete old videos concurrently
+    RECONNECT_INTERVAL = 5 # Seconds between automatic reconnect attempts when the WebSocket drops
+    HEALTH_CHECK_TIMEOUT = 2.0 # Seconds to wait for OBS to answer a health check probe
+
     def __init__(self, password:str, port:str = 4455, host:str = "localhost", **kwargs):
         self.host = host
         self.port = port
         self.password = password
         self.ws = None
+        self._connected = False
         self.process_name = "obs64.exe"
-        self.replay_save_path = Path(kwargs.get("replay_path")) if kwargs.get("replay_path") else Path(os.path.expandvars(r"%USERPROFILE%/Videos"))
-        self.cwd = Path(kwargs.get("obs_path") + "/bin/64bit") if kwargs.get("obs_path") else Path("C:/Program Files/obs-studio/bin/64bit")
-        self.obs_profiles_path = Path(os.path.expandvars("%AppData%")) / "obs-studio" / "basic" / "profiles"
-        self.obs_global_ini = Path(os.path.expandvars("%AppData%")) / "obs-studio" / "global.ini"
-        self.module_profile_path = Path(__file__).parent / "profiles" / "obs_controller"
+        paths = self._paths()
+        self.replay_save_path = Path(kwargs.get("replay_path")) if kwargs.get("replay_path") else paths.videos
+        self.cwd = Path(kwargs.get("obs_path") + "/bin/64bit") if kwargs.get("obs_path") else paths.obs_bin
+        self.obs_profiles_path = paths.profiles
+        self.obs_global_ini = paths.global_ini
+        self.module_profile_path = paths.module_profile
         self.max_folder_size = int(kwargs.get("max_folder_size", 1024*1024*1024*5)) # Default 5 GB
         self.timeout = kwargs.get("timeout", 300)
         self.process = None
+        self._proc_cache = None # (timestamp, result) of the last is_process_running lookup
+        self._replay_event = threading.Event()
+        self._replay_path = None
+        self._obs_version = None
+        self._obs_installed = False
         atexit.register(self.cleanup)
     
     
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _paths(cls) -> SimpleNamespace:
+        """
+        Resolves the default paths used by the controller, expanding environment variables only once per process.
+
+        Returns:
+            SimpleNamespace: The default videos, OBS binary, profiles, global.ini and module profile paths.
+        """
+        app_data = Path(os.path.expandvars("%AppData%")) / "obs-studio"
+        return SimpleNamespace(
+            videos=Path(os.path.expandvars(r"%USERPROFILE%/Videos")),
+            obs_bin=Path("C:/Program Files/obs-studio/bin/64bit"),
+            profiles=app_data / "basic" / "profiles",
+            global_ini=app_data / "global.ini",
+            module_profile=Path(__file__).parent / "profiles" / "obs_controller",
+        )
+    
+    
     def enable_websocket(self) -> bool:
         """
         Enables the OBS WebSocket server by modifying the global.ini configuration file.
@@ -45,11 +165,10 @@ class OBSController:
         
         Process:
             1. Verify the existence of the global.ini file.
-            2. Read the file content with utf-8-sig encoding to handle BOM.
-            3. Remove the BOM if present.
-            4. Parse the configuration content.
-            5. Update the WebSocket server settings.
-            6. Write the updated configuration back to the global.ini file.
+            2. Read the file content and decode it with utf-8-sig encoding to handle BOM.
+            3. Replace the WebSocket server settings in the [OBSWebSocket] section, adding
+               the section or keys if they are missing.
+            4. Write the configuration back to the global.ini file if anything changed.
         
         Returns:
             bool: `True` if global.ini is successfully updated, `False` otherwise.
@@ -58,30 +177,49 @@ class OBSController:
             RuntimeError: If an error occurs while attempting to read or write the global.ini file.
         """
         try:
-            if not self.obs_global_ini.exists():
+            try:
+                size = self.obs_global_ini.stat().st_size
+            except FileNotFoundError:
                 logger.error("obs_controller was not able to locate the global.ini file")
                 return False
-                
-            # Load the configuration from the predefined profile
-            config = configparser.ConfigParser()
-            config.optionxform = str # Preserve the case of keys
-            with open(self.obs_global_ini, 'r', encoding='utf-8-sig') as f:
-                content = f.read()
-            
-            if content.startswith("\ufeff"):
-                content = content[1:]
-            
-            config.read_string(content)
-            
-            # Update WebSocket server settings in the configuration
-            config["OBSWebSocket"]["ServerEnabled"] = "true"
-            config["OBSWebSocket"]["ServerPort"] = str(self.port)
-            config["OBSWebSocket"]["ServerPassword"] = str(self.password)
-            
-            # Write the updated configuration
-            with open(self.obs_global_ini, 'w', encoding='utf-8-sig') as f:
-                config.write(f, space_around_delimiters=False)
-                
+
+            # Read the raw bytes into a preallocated buffer and decode once, keeping the original line endings
+            buf = bytearray(size)
+            with open(self.obs_global_ini, 'rb', buffering=0) as f:
+                del buf[f.readinto(buf):]
+            text = buf.decode('utf-8-sig')
+            newline = "\r\n" if "\r\n" in text else "\n"
+            settings = {
+                "ServerEnabled": "true",
+                "ServerPort": str(self.port),
+                "ServerPassword": str(self.password),
+            }
+
+            # Only touch the keys inside the [OBSWebSocket] section
+            section = _WS_SECTION_RE.search(text)
+            if section:
+                found = set()
+                def replace_key(match):
+                    found.add(match.group(1))
+                    return f"{match.group(1)}={settings[match.group(1)]}"
+                body = _WS_KEY_RE.sub(replace_key, section.group(1))
+                missing = "".join(f"{key}={value}{newline}" for key, value in settings.items() if key not in found)
+                body = missing + body
+                head = text[:section.start(1)]
+                if missing and not head.endswith("\n"):
+                    # The section header is the last line and has no line ending
+                    head = head.rstrip("\r") + newline
+                new_text = head + body + text[section.end(1):]
+            else:
+                lines = "".join(f"{key}={value}{newline}" for key, value in settings.items())
+                separator = f"{newline}{newline}" if text.strip() else ""
+                new_text = text.rstrip("\r\n") + f"{separator}[OBSWebSocket]{newline}{lines}"
+
+            if new_text == text:
+                logger.debug("WebSocket server settings in global.ini are already up to date")
+                return True
+
+            self.obs_global_ini.write_bytes(new_text.encode('utf-8-sig'))
             logger.debug("Successfully updated the WebSocket server settings in global.ini")
         except Exception as e:
             logger.exception("Failed to update WebSocket server settings")
@@ -151,15 +289,21 @@ class OBSController:
             Exception: Logs any exceptions encountered during the cleanup process.
         """
         logger.debug("Starting cleanup process.")
+        self._obs_version = None
         try:
-            if self.ws and self.ws.ws.connected:
+            if self.ws:
+                self.ws.authreconnect = 0
+            if self.ws and self.is_connected:
+                self._connected = False
                 self.ws.disconnect()
                 logger.info("Successfully disconnected from OBS WebSocket.")
             else:
                 logger.debug("No active OBS WebSocket connection to disconnect.")
+            self.ws = None
 
             if self.process:
                 self.process.terminate()
+                self._proc_cache = None
                 logger.info("Successfully terminated the OBS process.")
             else:
                 logger.debug("No OBS process was running to terminate.")
@@ -169,50 +313,49 @@ class OBSController:
     
     def set_default_profile(self) -> None:
         """
-        Sets the default OBS profile by copying the configuration from a predefined profile.
+        Sets the default OBS profile by rendering the predefined profile template.
         
-        This method reads the configuration from a predefined profile located in the module's
-        directory, updates the file paths for output and recording to the configured replay save path,
-        and copies this configuration to the OBS profiles directory. If a profile with the same name
-        already exists in the destination, it is removed before copying the new profile.
+        This method reads the profile template located in the module's directory, fills in the
+        file paths for output and recording with the configured replay save path, and writes the
+        result to the OBS profiles directory. The profile is only rewritten when the file on disk differs
+        from the rendered one, so changes made by OBS or the user are still reverted.
 
         Steps:
-            1. Read the configuration from the module's 'basic.ini' file.
-            2. Update file paths in the configuration.
-            3. Check if the destination profile directory exists; if so, remove it.
+            1. Read the module's 'basic.ini.tmpl' template.
+            2. Substitute the replay save path into the template.
+            3. Compare the existing 'basic.ini' with the rendered profile; return if they are equal.
             4. Create the destination profile directory.
-            5. Write the updated configuration to the destination directory.
+            5. Atomically replace 'basic.ini' in the destination directory.
 
         Raises:
             RuntimeError: If any error occurs during the process, a RuntimeError is raised with the
                         appropriate error message.
         """
         try:
-            # Load the configuration from the predefined profile
-            config = configparser.ConfigParser()
-            config.optionxform = str # Preserve the case of keys
-            config.read(self.module_profile_path / "basic.ini")
-            
-            # Update file paths in the configuration
-            replay_path_str = str(self.replay_save_path.as_posix()) # Convert to POSIX so path is valid
-            config["SimpleOutput"]["FilePath"] = replay_path_str
-            config["AdvOut"]["RecFilePath"] = replay_path_str
-            config["AdvOut"]["FFFilePath"] = replay_path_str
+            # Render the predefined profile with the replay save path
+            template = (self.module_profile_path / "basic.ini.tmpl").read_text()
+            replay_path_str = self.replay_save_path.as_posix() # Convert to POSIX so path is valid
+            config = template.replace("{REPLAY_PATH}", replay_path_str)
             
             # Define the destination path for the specific profile
             destination_path = self.obs_profiles_path / "obs_controller"
+            profile_file = destination_path / "basic.ini"
 
-            # Check if the destination profile directory exists, remove it if it does
-            if destination_path.exists():
-                shutil.rmtree(destination_path)
-                logger.info("Existing profile directory at %s has been removed.", destination_path)
+            # Skip writing if the existing profile already matches the rendered one
+            try:
+                if profile_file.read_text() == config:
+                    logger.info("Default profile at %s is already up to date.", destination_path)
+                    return
+            except FileNotFoundError:
+                pass
 
             # Create the destination profile directory
-            os.makedirs(str(destination_path), exist_ok=True)
+            destination_path.mkdir(parents=True, exist_ok=True)
             
-            # Write the updated configuration to the destination directory
-            with open(destination_path / "basic.ini", 'w') as f:
-                config.write(f, space_around_delimiters=False)
+            # Write the rendered configuration to the destination directory
+            tmp_file = destination_path / "basic.ini.tmp"
+            tmp_file.write_text(config)
+            os.replace(tmp_file, profile_file)
                 
             logger.info("Successfully copied default profile to %s", destination_path)
         except Exception as e:
@@ -227,13 +370,18 @@ class OBSController:
         This method verifies the existence of the OBS executable (`obs64.exe`) in the directory
         specified by `self.cwd`. This directory is typically the OBS installation path. The method
         returns `True` if the executable is found, indicating that OBS is installed, and `False` otherwise.
+        A positive result is remembered, so the path is not checked again.
 
         Returns:
             bool: `True` if the OBS executable is found at the predefined path, `False` otherwise.
         """
+        if self._obs_installed:
+            return True
+
         try:
             obs_installation_path = self.cwd / self.process_name
-            if obs_installation_path.exists():
+            if obs_installation_path.is_file():
+                self._obs_installed = True
                 return True
             return False
         except Exception:
@@ -275,23 +423,50 @@ class OBSController:
             path = str(self.cwd / self.process_name)
             command = [path] + params
             self.process = subprocess.Popen(command, cwd=str(self.cwd))
+            self._proc_cache = None
         except Exception:
             logger.exception("Failed to start OBS:")
     
     
     def websocket_connection_health_check(self) -> bool:
         """
-        Performs a health check for the OBS WebSocket server without affecting existing connections.
+        Performs a health check for the OBS WebSocket server.
         
-        This method attempts to establish a new connection to the OBS WebSocket server using the
-        provided credentials (host, port, password). If the connection is successful, it logs the
-        success and immediately disconnects. If any error occurs during the connection attempt, it logs
-        the error and returns False.
+        If there is an active connection, a `GetVersion` request is sent through it and the returned
+        version is cached for `get_obs_version`. The probe waits at most `HEALTH_CHECK_TIMEOUT` seconds
+        for an answer. If the active connection does not respond, it is reconnected and probed once more,
+        so the check blocks for up to twice `HEALTH_CHECK_TIMEOUT` plus the reconnect handshake. If the
+        reconnected session does not respond either, the controller is marked as disconnected. Otherwise this method attempts to establish a new connection to the OBS WebSocket
+        server using the provided credentials (host, port, password). If the connection is successful,
+        it logs the success and immediately disconnects. If any error occurs during the connection
+        attempt, it logs the error and returns False.
 
         Returns:
             bool: `True` if the connection to the OBS WebSocket server is successful, `False` otherwise.
         """
         try:
+            obsws, _, requests = _lazy_obsws()
+            if self.is_connected:
+                try:
+                    self._probe_connection(requests)
+                    logger.debug("Health check: Existing OBS WebSocket connection is responsive.")
+                    return True
+                except Exception:
+                    logger.warning("Health check: Existing OBS WebSocket connection is unresponsive, reconnecting.")
+
+                try:
+                    self._connected = False
+                    self.ws.reconnect()
+                    # reconnect() leaves retrying to the client on failure, so confirm the new connection
+                    self._probe_connection(requests)
+                    self._connected = True
+                    logger.info("Health check: Reconnected to OBS WebSocket.")
+                    return True
+                except Exception:
+                    # _on_ws_connect may have set the flag during reconnect() even though the session is dead
+                    self._connected = False
+                    raise
+
             ws = obsws(self.host, self.port, self.password)
             ws.connect()
             logger.debug("Health check: Successfully connected to OBS WebSocket.")
@@ -303,29 +478,57 @@ class OBSController:
             return False
     
     
+    def _probe_connection(self, requests) -> None:
+        """
+        Sends a `GetVersion` request through the active connection, waiting at most `HEALTH_CHECK_TIMEOUT`
+        seconds for the answer. The response doubles as a version query, saving `get_obs_version` a roundtrip.
+
+        Raises:
+            Exception: If the request fails or OBS does not answer in time.
+        """
+        timeout = self.ws.timeout
+        self.ws.timeout = self.HEALTH_CHECK_TIMEOUT
+        try:
+            self._obs_version = self.ws.call(requests.GetVersion()).getObsVersion()
+        finally:
+            self.ws.timeout = timeout
+
+
     @property
     def is_connected(self) -> bool:
         """
         Checks if there is an active connection to the OBS WebSocket.
 
-        This method tries to determine if the WebSocket connection is active by accessing
-        the connected attribute of the WebSocket client. It handles any exceptions that
-        might occur if the WebSocket object is not initialized or in an erroneous state.
+        The connection state is tracked by a flag that is set by `connect` and cleared by `disconnect`,
+        `cleanup` and the WebSocket client's disconnect callback.
 
         Returns:
             bool: `True` if connected, `False` otherwise.
         """
-        try:
-            # Check if self.ws is initialized and has a WebSocket connection established
-            return getattr(self, "ws", None) is not None and self.ws.ws.connected
-        except AttributeError:
-            # This handles the case where self.ws or self.ws.ws does not exist
-            logger.error("WebSocket client is not properly initialized.")
-            return False
-        except Exception:
-            # General exception to catch any other unforeseen issues
-            logger.exception("Error checking connection status")
-            return False
+        return self._connected
+
+
+    def _on_ws_connect(self, ws) -> None:
+        """
+        Callback for obsws connecting, marks the controller as connected. Reconnects call it from obsws' receive
+        or reconnect thread. Clients other than `self.ws` are closed again.
+        """
+        if ws is self.ws:
+            self._connected = True
+        else:
+            # A reconnect of a client this controller already let go of, close it again
+            ws.authreconnect = 0
+            ws.disconnect()
+
+
+    def _on_ws_disconnect(self, ws) -> None:
+        """
+        Callback for obsws disconnecting, marks the controller as disconnected. Called from obsws' receive
+        thread when the connection drops. Clients other than `self.ws` are ignored.
+        """
+        if ws is self.ws:
+            self._connected = False
+            logger.debug("OBS WebSocket connection closed.")
 
 
     @require_process_running
@@ -335,6 +538,7 @@ class OBSController:
 
         This method first checks if the OBS process is running. If OBS is not running, it logs an error and returns False.
         If OBS is running, it tries to establish a WebSocket connection using the configured host, port, and password.
+        Automatic reconnects are only enabled once this first connection has succeeded.
         
         Returns:
             bool: `True` if the connection was successfully established, `False` otherwise.
@@ -343,8 +547,14 @@ class OBSController:
             Exception: Logs any exceptions that occur during the connection attempt.
         """
         try:
-            self.ws = obsws(self.host, self.port, self.password)
+            obsws, events, _ = _lazy_obsws()
+            self.ws = obsws(self.host, self.port, self.password,
+                            on_connect=self._on_ws_connect, on_disconnect=self._on_ws_disconnect)
+            self.ws.register(self._on_replay_saved, events.ReplayBufferSaved)
             self.ws.connect()
+            # Only reconnect automatically once the first handshake succeeded, so a failed connect raises
+            self.ws.authreconnect = self.RECONNECT_INTERVAL
+            self._connected = True
             logger.info("Connected to OBS WebSocket.")
             return True
         except Exception:
@@ -367,6 +577,8 @@ class OBSController:
             return False
 
         try:
+            self._connected = False
+            self.ws.authreconnect = 0
             self.ws.disconnect()
             logger.info("Successfully disconnected from OBS WebSocket.")
             return True
@@ -375,32 +587,44 @@ class OBSController:
             raise OBSConnectionError("Disconnection failed") from e
         finally:
             self.ws = None
+            self._obs_version = None
 
     @property
     def is_process_running(self) -> bool:
         """
         Checks if a specific process is currently running on the system.
 
-        This method iterates over all running processes and compares their names with the specified process name,
-        ignoring any processes that are inaccessible due to permissions or are no longer active.
+        If OBS was launched by this controller, the spawned process is polled directly. Otherwise this
+        method walks a snapshot of the running processes and compares their names with the specified process name.
+        The result is cached for `PROCESS_CACHE_TTL` seconds to avoid repeated process table scans.
 
         Returns:
             bool: `True` if the specified process is found among active processes, `False` otherwise.
 
         """
+        now = time.monotonic()
+        if self._proc_cache and now - self._proc_cache[0] < self.PROCESS_CACHE_TTL:
+            return self._proc_cache[1]
+
         try:
-            pythoncom.CoInitialize()
-            process_name = self.process_name.lower()
-            strComputer = "."
-            objWMIService = win32com.client.Dispatch("WbemScripting.SWbemLocator")
-            objSWbemServices = objWMIService.ConnectServer(strComputer,"root\cimv2")
-            colItems = objSWbemServices.ExecQuery("SELECT * FROM Win32_Process WHERE Name = '{}'".format(process_name))
-            return len(colItems) > 0
+            if self.process and self.process.poll() is None:
+                result = True
+            else:
+                result = _process_exists(self.process_name)
         except Exception:
             logger.exception("is_process_running encountered an unexpected error")
-        finally:
-            pythoncom.CoUninitialize()
-            
+            return False
+
+        self._proc_cache = (now, result)
+        return result
+
+
+    def _on_replay_saved(self, message) -> None:
+        """
+        Callback for the `ReplayBufferSaved` event, records the saved path and wakes up `save_replay`.
+        """
+        self._replay_path = message.getSavedReplayPath()
+        self._replay_event.set()
 
 
     @require_connection
@@ -408,6 +632,10 @@ class OBSController:
         """
         Attempts to save the replay buffer to a file, verifying that a new file is created.
 
+        This method waits for OBS to emit the `ReplayBufferSaved` event. While waiting, the save path is
+        checked for a new video file every `REPLAY_POLL_INTERVAL` seconds as a fallback in case the event
+        is missed.
+
         Raises:
             NotConnectedException: If method is running without having an active connection.
 
@@ -416,14 +644,23 @@ class OBSController:
         """
 
         latest_file_before = self.get_latest_video()
-        deadline = time.time() + self.timeout
+        self._replay_path = None
+        self._replay_event.clear()
+        deadline = time.monotonic() + self.timeout
 
         try:
+            _, _, requests = _lazy_obsws()
+
             # Request to save the replay buffer
             self.ws.call(requests.SaveReplayBuffer())
 
-            # Check for the creation of a new video file until timeout
-            while time.time() <= deadline:
+            while (remaining := deadline - time.monotonic()) > 0:
+                # Wait for OBS to report the saved replay
+                if self._replay_event.wait(min(remaining, self.REPLAY_POLL_INTERVAL)):
+                    logger.info("Replay saved to: %s", self._replay_path)
+                    return True
+
+                # Fall back to checking for the creation of a new video file
                 latest_file_after = self.get_latest_video()
                 if latest_file_before is None and latest_file_after:
                     # If no file was there before and now there is one, success!
@@ -433,7 +670,6 @@ class OBSController:
                     # If there was a file before and a new file is different, success!
                     logger.info("Replay saved to: %s", latest_file_after.get("path", ""))
                     return True
-                time.sleep(1)  # Delay to prevent high CPU load
 
             logger.warning("Failed to save replay: timeout reached without detecting a new file.")
             return False
@@ -454,6 +690,8 @@ class OBSController:
             bool: `True` if the replay buffer was started successfully, `False` otherwise.
         """
         try:
+            _, _, requests = _lazy_obsws()
+
             # Request to start the replay buffer
             self.ws.call(requests.StartReplayBuffer())
 
@@ -476,6 +714,8 @@ class OBSController:
             bool: `True` if the replay buffer was stopped successfully, `False` otherwise.
         """
         try:
+            _, _, requests = _lazy_obsws()
+
             # Request to stop the replay buffer
             self.ws.call(requests.StopReplayBuffer())
 
@@ -499,14 +739,13 @@ class OBSController:
                 modification time, creation time, and access time, or None if no video file is found or an error occurs.
         """
         try:
-            # Find the latest video file based on modification time
-            latest_video = max(self.replay_save_path.glob('*.mp4'), key=lambda p: p.stat().st_mtime, default=None)
-            if not latest_video:
+            # Find the latest video file based on modification time, reusing the stats from the scan
+            latest = max(((e.path, e.stat()) for e in self._iter_mp4s()), key=lambda t: t[1].st_mtime, default=None)
+            if not latest:
                 logger.debug("No MP4 files found in the directory.")
                 return None
 
-            # Caching file stats to minimize file system interactions
-            video_stats = latest_video.stat()
+            latest_video, video_stats = latest
 
             # Convert timestamps format
             modification_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(video_stats.st_mtime))
@@ -524,6 +763,40 @@ class OBSController:
             return None
     
     
+    def _iter_mp4s(self) -> Iterator[os.DirEntry]:
+        """
+        Yields the MP4 video files in the designated save path.
+
+        Entries are filtered on their name before the cached `DirEntry` type check, without compiling a glob pattern.
+
+        Yields:
+            os.DirEntry: One entry for each MP4 file. Nothing if the save path does not exist.
+        """
+        try:
+            it = os.scandir(self.replay_save_path)
+        except FileNotFoundError:
+            logger.debug("Replay save path %s does not exist.", self.replay_save_path)
+            return
+
+        with it:
+            for entry in it:
+                if entry.name.endswith('.mp4') and entry.is_file():
+                    yield entry
+
+
+    def _scan_mp4s(self) -> list[tuple[str, os.stat_result]]:
+        """
+        Lists the MP4 video files in the designated save path along with their stats.
+
+        The directory is read with a single `os.scandir` pass so each file is only stat'ed once. The result
+        can be shared between `check_and_manage_folder_size` and `cleanup_videos`.
+
+        Returns:
+            list: A list of `(path, stat_result)` tuples, one for each MP4 file. Empty if the save path does not exist.
+        """
+        return [(entry.path, entry.stat()) for entry in self._iter_mp4s()]
+
+
     def check_and_manage_folder_size(self) -> None:
         """
         Checks the total size of video files in the designated directory and initiates cleanup
@@ -533,52 +806,90 @@ class OBSController:
         self.replay_save_path. If this total exceeds self.max_folder_size, it calls the
         cleanup_videos method to delete the oldest files until the total size is within the limit.
         """
-        total_size = sum(f.stat().st_size for f in self.replay_save_path.glob('*.mp4'))
+        entries = self._scan_mp4s()
+        total_size = sum(st.st_size for _, st in entries)
         if total_size > self.max_folder_size:
             logger.info("Total folder size %s exceeds maximum of %s. Initiating cleanup.", total_size, self.max_folder_size)
-            self.cleanup_videos()
+            self.cleanup_videos(entries)
         else:
             logger.info("Total folder size %s is within the limit of %s.", total_size, self.max_folder_size)
 
 
-    def cleanup_videos(self) -> None:
+    def cleanup_videos(self, entries: list[tuple[str, os.stat_result]]|None = None) -> None:
         """
         Deletes the oldest MP4 video files in the directory until the total folder size
         is below the configured maximum limit.
 
-        This method sorts the video files by creation time and sequentially removes the oldest file
-        until the folder's total size meets the specified maximum size condition. Each deletion is
-        logged, and errors during file deletion are caught and logged.
-        """
-        videos = sorted(self.replay_save_path.glob('*.mp4'), key=lambda f: f.stat().st_ctime)
-        current_size = sum(f.stat().st_size for f in videos)
+        This method sorts the video files by creation time and selects the oldest files needed for the
+        folder's total size to meet the specified maximum size condition. The selected files are deleted
+        concurrently using up to `CLEANUP_WORKERS` threads. Each deletion is logged, and errors during
+        file deletion are caught and logged, in which case the next oldest files are selected.
+
+        Args:
+            entries (list, optional): `(path, stat_result)` tuples as returned by `_scan_mp4s`.
+                The save path is scanned if not provided.
+        """
+        if entries is None:
+            entries = self._scan_mp4s()
+
+        videos = sorted(entries, key=lambda t: t[1].st_ctime)
+        current_size = sum(st.st_size for _, st in videos)
+
+        remaining = iter(videos)
+
+        with ThreadPoolExecutor(max_workers=self.CLEANUP_WORKERS) as executor:
+            while current_size > self.max_folder_size:
+                # Select the oldest videos needed to get below the limit
+                batch = []
+                projected_size = current_size
+                for video in remaining:
+                    batch.append(video)
+                    projected_size -= video[1].st_size
+                    if projected_size <= self.max_folder_size:
+                        break
+                if not batch:
+                    break
+
+                futures = [(executor.submit(os.remove, path), path, stats) for path, stats in batch]
+                for future, oldest_video, video_stats in futures:
+                    error = future.exception()
+                    if error:
+                        logger.error("Could not delete video %s", oldest_video, exc_info=error)
+                        continue
+                    current_size -= video_stats.st_size
+                    logger.info("Deleted old video: %s (freed %s bytes)", oldest_video, video_stats.st_size)
 
-        while videos and current_size > self.max_folder_size:
-            oldest_video = videos.pop(0)
-            try:
-                os.remove(oldest_video)
-                removed_size = oldest_video.stat().st_size
-                current_size -= removed_size
-                logger.info("Deleted old video: %s (freed %s bytes)",oldest_video, removed_size)
-            except Exception:
-                logger.exception("Could not delete video %s", oldest_video)
 
     def get_obs_version(self) -> str:
         """
         Retrieves the version of the installed OBS Studio application.
 
+        The active connection is reused if there is one, otherwise a temporary connection is opened.
+        The version is cached until the controller disconnects.
+
         Returns:
             str: The version string of the installed OBS Studio application.
         """
+        if self._obs_version:
+            return self._obs_version
+
+        ws = None
+        owned = not self.is_connected
         try:
-            ws = obsws(self.host, self.port, self.password)
-            ws.connect()
-            return ws.call(requests.GetVersion()).getObsVersion()
+            obsws, _, requests = _lazy_obsws()
+            if owned:
+                ws = obsws(self.host, self.port, self.password)
+                ws.connect()
+            else:
+                ws = self.ws
+            self._obs_version = ws.call(requests.GetVersion()).getObsVersion()
+            return self._obs_version
         except Exception:
             logger.exception("Failed to retrieve OBS Studio version")
             return "Unknown"
         finally:
-            try:
-                ws.disconnect()
-            except Exception:
-                pass
\ No newline at end of file
+            if owned and ws:
+                try:
+                    ws.disconnect()
+                except Exception:
+                    pass
\ No newline at end of file